@@ -17,6 +17,15 @@ from core.dispatcher import dispatcher
 from core.webhook_manager import WebhookManager
 from config.settings import get_settings
 
+# Use the libuv event loop when available - it handles noticeably more
+# webhook deliveries per core than the default selector loop
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 # Setup logging first
 setup_logging()
 logger = get_logger(__name__)
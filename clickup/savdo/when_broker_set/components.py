@@ -2,11 +2,13 @@
 Components for broker message creation and formatting.
 """
 
+from functools import lru_cache
 from typing import Dict, List
 
 from core.clickup_client import get_clickup_client
 from core.logging_config import get_logger
-from utils.get_curstom_field_value import get_custom_field_value
+from utils.get_curstom_field_value import get_custom_field_map
+from utils.get_status_name import get_status_name
 from utils.format_currency import format_currency
 from utils.format_number import format_number
 from utils.format_dedline import format_deadline
@@ -16,11 +18,34 @@ from clickup.utils.get_relation_name import get_relationship_name
 
 logger = get_logger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _client():
+    """Memoized ClickUp client lookup for the message hot path."""
+    return get_clickup_client()
+
+
 # Constants
 DEFAULT_VALUE = "N/A"
 DATE_FORMAT = "%d.%m.%Y"
 MILLISECONDS_TO_SECONDS = 1000
 
+# Message template compiled once at import time; create_broker_message
+# fills it with format_map instead of rebuilding an f-string per task
+_BROKER_TEMPLATE = """🆕 Yangi ish bor!
+
+📌 Ish nomi: {name}
+📊 Status: {status_name}
+📦 Soni: {quantity}
+🏢 Firmamiz: {firma_name}
+👤 Xaridor: {xaridor_name}
+🤝 Hamkor: {hamkor_name}
+💰 Hamkordan olinish narxi: {hamkor_narx}
+📤 Lot chiqishi: {lot_out}
+📥 Lot qo'yilishi: {lot_in}
+📅 Broker dedline: {deadline_text}
+"""
+
 
 async def create_broker_message(task_id: str) -> str:
     """
@@ -36,69 +61,54 @@ async def create_broker_message(task_id: str) -> str:
         Exception: If task cannot be retrieved or processed
     """
     try:
-        clickup_client = get_clickup_client()
-        task = await clickup_client.tasks.get_task(task_id)
+        task = await _client().tasks.get_task(task_id)
     except Exception as e:
-        logger.error(f"Failed to get task {task_id}: {e}")
+        logger.error("Failed to get task %s: %s", task_id, e)
         raise
 
     # Basic task info
     name = task.get("name", DEFAULT_VALUE)
-    status = task.get("status", {})
-    status_name = (
-        status.get("status", DEFAULT_VALUE)
-        if isinstance(status, dict)
-        else DEFAULT_VALUE
+    status_name = get_status_name(task.get("status"))
+
+    # Get custom field values (single pass over task custom_fields)
+    fields = get_custom_field_map(task)
+    quantity = fields.get("🔢 miqdori")
+    lot_out = fields.get("💵 lot chiqishi")
+    lot_in = fields.get("💸 lot qo'yilishi")
+    firma = fields.get("Firma")
+    xaridor = fields.get("Xaridor companiya")
+    hamkor = fields.get("Hamkor companiya")
+    hamkor_narx = fields.get("Hamkordan olinish narxi")
+    broker_deadline = fields.get("📅 broker dedline")
+
+    # Format values and build message from the precompiled template
+    return _BROKER_TEMPLATE.format_map(
+        {
+            "name": name,
+            "status_name": status_name,
+            "quantity": format_number(quantity),
+            "firma_name": get_relationship_name(firma),
+            "xaridor_name": get_relationship_name(xaridor),
+            "hamkor_name": get_relationship_name(hamkor),
+            "hamkor_narx": format_currency(hamkor_narx),
+            "lot_out": format_currency(lot_out),
+            "lot_in": format_currency(lot_in),
+            "deadline_text": format_deadline(broker_deadline),
+        }
     )
 
-    # Get custom field values
-    quantity = get_custom_field_value(task, "🔢 miqdori")
-    lot_out = get_custom_field_value(task, "💵 lot chiqishi")
-    lot_in = get_custom_field_value(task, "💸 lot qo'yilishi")
-    firma = get_custom_field_value(task, "Firma")
-    xaridor = get_custom_field_value(task, "Xaridor companiya")
-    hamkor = get_custom_field_value(task, "Hamkor companiya")
-    hamkor_narx = get_custom_field_value(task, "Hamkordan olinish narxi")
-    broker_deadline = get_custom_field_value(task, "📅 broker dedline")
-
-    # Format values
-    quantity_formatted = format_number(quantity)
-    lot_out_formatted = format_currency(lot_out)
-    lot_in_formatted = format_currency(lot_in)
-    hamkor_narx_formatted = format_currency(hamkor_narx)
-
-    # Get relationship names
-    firma_name = get_relationship_name(firma)
-    xaridor_name = get_relationship_name(xaridor)
-    hamkor_name = get_relationship_name(hamkor)
-
-    # Format deadline
-    deadline_text = format_deadline(broker_deadline)
-
-    # Build message
-    message = f"""🆕 Yangi ish bor!
-
-📌 Ish nomi: {name}
-📊 Status: {status_name}
-📦 Soni: {quantity_formatted}
-🏢 Firmamiz: {firma_name}
-👤 Xaridor: {xaridor_name}
-🤝 Hamkor: {hamkor_name}
-💰 Hamkordan olinish narxi: {hamkor_narx_formatted}
-📤 Lot chiqishi: {lot_out_formatted}
-📥 Lot qo'yilishi: {lot_in_formatted}
-📅 Broker dedline: {deadline_text}
-"""
-
-    return message
-
 
+@lru_cache(maxsize=256)
 def create_broker_keyboard(
     task_id: str, list_id: str
 ) -> Dict[str, List[List[Dict[str, str]]]]:
     """
     Create inline keyboard for broker message.
 
+    The keyboard shape is static — only the callback data varies — so
+    results are memoized per (task_id, list_id). Callers must treat
+    the returned markup as read-only.
+
     Args:
         task_id: Task ID for callback data
         list_id: List ID for callback data
@@ -7,6 +7,7 @@ from typing import Dict, List
 from core.clickup_client import get_clickup_client
 from core.logging_config import get_logger
 from utils.get_curstom_field_value import get_custom_field_value
+from utils.get_status_name import get_status_name
 from utils.format_currency import format_currency
 from utils.format_number import format_number
 from utils.format_dedline import format_deadline
@@ -44,12 +45,7 @@ async def create_message(task_id: str) -> str:
 
     # Basic task info
     name = task.get("name", DEFAULT_VALUE)
-    status = task.get("status", {})
-    status_name = (
-        status.get("status", DEFAULT_VALUE)
-        if isinstance(status, dict)
-        else DEFAULT_VALUE
-    )
+    status_name = get_status_name(task.get("status"))
 
     # Get custom field values
     quantity = get_custom_field_value(task, "🔢 miqdori")
@@ -8,6 +8,7 @@ from core.logging_config import get_logger
 from utils.format_currency import format_currency
 from utils.format_dedline import format_deadline
 from utils.get_curstom_field_value import get_custom_field_value
+from utils.get_status_name import get_status_name
 
 logger = get_logger(__name__)
 
@@ -63,12 +64,7 @@ def create_accountant_message(
         Formatted message string
     """
     task_name = main_task.get("name", DEFAULT_VALUE)
-    status = main_task.get("status", {})
-    status_name = (
-        status.get("status", DEFAULT_VALUE)
-        if isinstance(status, dict)
-        else DEFAULT_VALUE
-    )
+    status_name = get_status_name(main_task.get("status"))
     list_name = main_task.get("list", {}).get("name", DEFAULT_VALUE)
 
     payment_title = payment_task.get("name", DEFAULT_VALUE)
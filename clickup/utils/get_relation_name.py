@@ -26,15 +26,18 @@ def get_relationship_name(custom_field_value: Optional[Union[Dict, List, str]])
     if not custom_field_value:
         return DEFAULT_VALUE
 
-    if isinstance(custom_field_value, list):
-        if len(custom_field_value) > 0:
-            first_item = custom_field_value[0]
-            if isinstance(first_item, dict):
-                return first_item.get("name", DEFAULT_VALUE)
-            return str(first_item)
-        return DEFAULT_VALUE
-
-    if isinstance(custom_field_value, dict):
+    # Exact type checks: relation values come straight from JSON, so
+    # dict/list subclasses never occur and type() is cheaper than
+    # isinstance's MRO walk
+    value_type = type(custom_field_value)
+
+    if value_type is list:
+        first_item = custom_field_value[0]
+        if type(first_item) is dict:
+            return first_item.get("name", DEFAULT_VALUE)
+        return str(first_item)
+
+    if value_type is dict:
         return custom_field_value.get("name", DEFAULT_VALUE)
 
     return str(custom_field_value)
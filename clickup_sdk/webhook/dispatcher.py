@@ -2,6 +2,7 @@
 from typing import Callable, Dict, List, Any, Optional, Awaitable, Union, Tuple
 from collections import defaultdict
 import asyncio
+import inspect
 import logging
 
 from .events import WebhookEvent, WebhookEventType
@@ -125,9 +126,18 @@ class WebhookDispatcher:
         results = []
         for handler, filter_obj in handler_tuples:
             try:
-                # Check filter if present
+                # Check filter if present (built-in filters are sync;
+                # custom async checks are awaited)
                 if filter_obj:
-                    filter_passed = await filter_obj.check(event)
+                    # Skip filters that are bound to a different event
+                    # type without evaluating them at all
+                    required_event = getattr(filter_obj, "REQUIRED_EVENT", None)
+                    if required_event is not None and required_event != event_type:
+                        continue
+
+                    filter_passed = filter_obj.check(event)
+                    if inspect.isawaitable(filter_passed):
+                        filter_passed = await filter_passed
                     if not filter_passed:
                         logger.debug(f"Filter {filter_obj.__class__.__name__} did not pass for event {event_type}")
                         continue
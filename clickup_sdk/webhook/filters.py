@@ -1,7 +1,8 @@
 """Webhook Event Filters - aiogram style filters"""
 
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, NamedTuple
 from abc import ABC, abstractmethod
+import inspect
 import logging
 import json
 
@@ -10,14 +11,82 @@ from .events import WebhookEvent
 logger = logging.getLogger(__name__)
 
 
+class _ParsedItem(NamedTuple):
+    """Normalized view of one history item, decoded once per event"""
+
+    item: Dict[str, Any]
+    field: str
+    field_lc: str
+    item_id: Any
+    field_id_str: Optional[str]
+    before: Any
+    after: Any
+    before_d: Optional[Dict[str, Any]]
+    after_d: Optional[Dict[str, Any]]
+
+
+def _parsed_history(event: WebhookEvent) -> List[_ParsedItem]:
+    """
+    Decode event history items once and cache the result on the event.
+
+    When a dispatcher fans one event out to many filters, each filter
+    would otherwise re-extract and re-normalize the same before/after
+    structures. The cache lives on the event instance, so it is built
+    at most once per webhook delivery.
+
+    Args:
+        event: Webhook event
+
+    Returns:
+        List of parsed history items
+    """
+    cached = event.__dict__.get("_parsed_history")
+    if cached is not None:
+        return cached
+
+    parsed = []
+    for item in event.history_items or ():
+        field = item.get("field", "")
+        item_id = item.get("id")
+        field_id = item.get("field_id") or item_id
+        before = item.get("before", {})
+        after = item.get("after", {})
+        parsed.append(
+            _ParsedItem(
+                item=item,
+                field=field,
+                field_lc=field.lower().strip() if field else "",
+                item_id=item_id,
+                field_id_str=str(field_id).strip() if field_id is not None else None,
+                before=before,
+                after=after,
+                before_d=before if isinstance(before, dict) else None,
+                after_d=after if isinstance(after, dict) else None,
+            )
+        )
+
+    event.__dict__["_parsed_history"] = parsed
+    return parsed
+
+
 class Filter(ABC):
     """Base filter class"""
 
+    #: Event type this filter can ever match, or None for any event.
+    #: The dispatcher uses this to skip check() entirely for events of
+    #: a different type.
+    REQUIRED_EVENT: Optional[str] = None
+
     @abstractmethod
-    async def check(self, event: WebhookEvent) -> bool:
+    def check(self, event: WebhookEvent) -> bool:
         """
         Check if event matches filter.
 
+        Built-in filters are pure CPU checks, so check() is a plain
+        function — no coroutine is created per invocation. Subclasses
+        may still define an async check; the dispatcher and
+        CombinedFilter await the result when it is awaitable.
+
         Args:
             event: Webhook event
 
@@ -30,6 +99,8 @@ class Filter(ABC):
 class CustomFieldFilter(Filter):
     """Filter for custom field changes"""
 
+    REQUIRED_EVENT = "taskUpdated"
+
     def __init__(
         self,
         field_id: Optional[str] = None,
@@ -57,6 +128,11 @@ class CustomFieldFilter(Filter):
         self.on_remove = on_remove
         self.on_update = on_update
 
+        # Precomputed match targets so check() does not re-normalize
+        # them for every history item
+        self._field_id_str = str(field_id).strip() if field_id else None
+        self._field_name_lc = field_name.lower().strip() if field_name else None
+
     def _is_empty(self, value) -> bool:
         """Check if value is considered empty"""
         if value is None:
@@ -92,7 +168,7 @@ class CustomFieldFilter(Filter):
             return "update"
         return None
 
-    async def check(self, event: WebhookEvent) -> bool:
+    def check(self, event: WebhookEvent) -> bool:
         """Check if custom field changed"""
         if event.event != "taskUpdated":
             return False
@@ -100,11 +176,16 @@ class CustomFieldFilter(Filter):
         if not event.history_items:
             return False
 
-        for item in event.history_items:
-            field = item.get("field", "")
-            field_id = item.get("field_id") or item.get("id")
-            before = item.get("before", {})
-            after = item.get("after", {})
+        for parsed in _parsed_history(event):
+            item = parsed.item
+            field = parsed.field
+            field_lc = parsed.field_lc
+            item_id = parsed.item_id
+            field_id_str = parsed.field_id_str
+            before = parsed.before
+            after = parsed.after
+            before_d = parsed.before_d
+            after_d = parsed.after_d
 
             # Determine change type
             change_type = self._check_change_type(before, after)
@@ -119,16 +200,26 @@ class CustomFieldFilter(Filter):
 
             # Check by field ID
             if self.field_id:
-                target_id = str(self.field_id).strip()
-
-                # Direct field_id match in item root
-                if field_id and str(field_id).strip() == target_id:
-                    return True
-                if item.get("id") and str(item.get("id")).strip() == target_id:
+                target_id = self._field_id_str
+
+                # Collect shallow candidate IDs once, then one set lookup
+                # instead of a ladder of separate comparisons
+                candidates = set()
+                if field_id_str:
+                    candidates.add(field_id_str)
+                if item_id is not None:
+                    candidates.add(str(item_id).strip())
+                for d in (after_d, before_d):
+                    if d is not None:
+                        for key in ("id", "field_id", "custom_field_id"):
+                            value = d.get(key)
+                            if value is not None:
+                                candidates.add(str(value).strip())
+                if target_id in candidates:
                     return True
 
                 # Check if field_id is in the field string
-                if field and target_id in str(field):
+                if field and target_id in field:
                     return True
 
                 # Helper function to recursively search for field_id
@@ -163,13 +254,13 @@ class CustomFieldFilter(Filter):
                     return False
 
                 # Check in after dict
-                if isinstance(after, dict):
-                    if find_field_id_in_dict(after, target_id):
+                if after_d is not None:
+                    if find_field_id_in_dict(after_d, target_id):
                         return True
 
                 # Check in before dict
-                if isinstance(before, dict):
-                    if find_field_id_in_dict(before, target_id):
+                if before_d is not None:
+                    if find_field_id_in_dict(before_d, target_id):
                         return True
 
                 # Deep search in entire item (as last resort)
@@ -179,63 +270,36 @@ class CustomFieldFilter(Filter):
 
             # Check by field name
             if self.field_name:
-                search_name = self.field_name.lower().strip()
-
-                # Direct field name match (case insensitive, substring match)
-                if field:
-                    field_lower = field.lower().strip()
-                    if (
-                        search_name == field_lower
-                        or search_name in field_lower
-                        or field_lower in search_name
-                    ):
-                        return True
+                search_name = self._field_name_lc
+
+                # Collect lowercase name candidates (field string plus
+                # name/label from before/after), then run the symmetric
+                # substring match once over all of them
+                name_candidates = []
+                if field_lc:
+                    name_candidates.append(field_lc)
+                for d in (after_d, before_d):
+                    if d is not None:
+                        for key in ("name", "label"):
+                            value = d.get(key)
+                            if value:
+                                name_candidates.append(str(value).lower().strip())
+                if any(
+                    search_name == cand
+                    or search_name in cand
+                    or cand in search_name
+                    for cand in name_candidates
+                ):
+                    return True
 
-                # Check after dict
-                if isinstance(after, dict):
-                    # Check name field
-                    if after.get("name"):
-                        name_lower = str(after.get("name", "")).lower().strip()
-                        if (
-                            search_name == name_lower
-                            or search_name in name_lower
-                            or name_lower in search_name
-                        ):
-                            return True
-                    # Check label field (some custom fields use label)
-                    if after.get("label"):
-                        label_lower = str(after.get("label", "")).lower().strip()
-                        if (
-                            search_name == label_lower
-                            or search_name in label_lower
-                            or label_lower in search_name
-                        ):
-                            return True
-                    # Check value field if it contains name
-                    if after.get("value"):
-                        value_str = str(after.get("value", "")).lower()
+                # Check value field if it contains name
+                if after_d is not None:
+                    value_val = after_d.get("value")
+                    if value_val:
+                        value_str = str(value_val).lower()
                         if search_name in value_str:
                             return True
 
-                # Check before dict
-                if isinstance(before, dict):
-                    if before.get("name"):
-                        name_lower = str(before.get("name", "")).lower().strip()
-                        if (
-                            search_name == name_lower
-                            or search_name in name_lower
-                            or name_lower in search_name
-                        ):
-                            return True
-                    if before.get("label"):
-                        label_lower = str(before.get("label", "")).lower().strip()
-                        if (
-                            search_name == label_lower
-                            or search_name in label_lower
-                            or label_lower in search_name
-                        ):
-                            return True
-
                 # Check if field name is in the entire item structure (deep search)
                 item_str = json.dumps(item, default=str).lower()
                 if search_name in item_str:
@@ -247,6 +311,8 @@ class CustomFieldFilter(Filter):
 class TaskStatusFilter(Filter):
     """Filter for specific task status changes"""
 
+    REQUIRED_EVENT = "taskStatusUpdated"
+
     def __init__(
         self, from_status: Optional[str] = None, to_status: Optional[str] = None
     ):
@@ -260,6 +326,11 @@ class TaskStatusFilter(Filter):
         self.from_status = from_status
         self.to_status = to_status
 
+        # Pre-lowered forms so check() compares without re-lowering
+        # the configured statuses for every history item
+        self._from_lc = from_status.lower() if from_status else None
+        self._to_lc = to_status.lower() if to_status else None
+
     @staticmethod
     def _extract_status(value: Any) -> str:
         """
@@ -288,7 +359,7 @@ class TaskStatusFilter(Filter):
 
         return str(value).strip()
 
-    async def check(self, event: WebhookEvent) -> bool:
+    def check(self, event: WebhookEvent) -> bool:
         """Check if status changed to/from specified status"""
         if event.event != "taskStatusUpdated":
             return False
@@ -296,19 +367,13 @@ class TaskStatusFilter(Filter):
         if not event.history_items:
             return False
 
-        for item in event.history_items:
-            before = item.get("before")
-            after = item.get("after")
-
-            old_status = self._extract_status(before).lower()
-            new_status = self._extract_status(after).lower()
-
+        for parsed in _parsed_history(event):
             # Check from_status
-            if self.from_status and old_status != self.from_status.lower():
+            if self._from_lc and self._extract_status(parsed.before).lower() != self._from_lc:
                 continue
 
             # Check to_status
-            if self.to_status and new_status != self.to_status.lower():
+            if self._to_lc and self._extract_status(parsed.after).lower() != self._to_lc:
                 continue
 
             return True
@@ -319,6 +384,8 @@ class TaskStatusFilter(Filter):
 class TaskAssigneeFilter(Filter):
     """Filter for task assignee changes"""
 
+    REQUIRED_EVENT = "taskAssigneeUpdated"
+
     def __init__(self, user_id: Optional[str] = None):
         """
         Initialize task assignee filter.
@@ -328,7 +395,16 @@ class TaskAssigneeFilter(Filter):
         """
         self.user_id = user_id
 
-    async def check(self, event: WebhookEvent) -> bool:
+        # ClickUp sends numeric IDs while callers often pass strings;
+        # normalize both forms once so check() compares without
+        # per-assignee conversions
+        self._uid_str = str(user_id) if user_id is not None else None
+        try:
+            self._uid_int = int(user_id) if user_id is not None else None
+        except (ValueError, TypeError):
+            self._uid_int = None
+
+    def check(self, event: WebhookEvent) -> bool:
         """Check if assignee changed"""
         if event.event != "taskAssigneeUpdated":
             return False
@@ -339,19 +415,20 @@ class TaskAssigneeFilter(Filter):
         if not event.history_items:
             return False
 
-        for item in event.history_items:
-            after = item.get("after", {})
-            if isinstance(after, dict):
+        for parsed in _parsed_history(event):
+            after = parsed.after_d
+            if after is not None:
                 assignees = after.get("assignees", [])
                 if isinstance(assignees, list):
                     for assignee in assignees:
-                        if (
-                            isinstance(assignee, dict)
-                            and assignee.get("id") == self.user_id
+                        if isinstance(assignee, dict):
+                            aid = assignee.get("id")
+                        else:
+                            aid = assignee
+                        if aid is not None and (
+                            aid == self._uid_int or aid == self._uid_str
                         ):
                             return True
-                        if assignee == self.user_id:
-                            return True
 
         return False
 
@@ -366,9 +443,9 @@ class EventTypeFilter(Filter):
         Args:
             event_types: List of event types to match
         """
-        self.event_types = [e.lower() for e in event_types]
+        self.event_types = frozenset(e.lower() for e in event_types)
 
-    async def check(self, event: WebhookEvent) -> bool:
+    def check(self, event: WebhookEvent) -> bool:
         """Check if event type matches"""
         return event.event.lower() in self.event_types
 
@@ -390,20 +467,40 @@ class CombinedFilter(Filter):
         if self.logic not in ["AND", "OR"]:
             raise ValueError("Logic must be 'AND' or 'OR'")
 
+        self._is_and = self.logic == "AND"
+
+        # Propagate a shared event-type requirement so the dispatcher
+        # can skip the whole chain for other event types
+        required = {getattr(f, "REQUIRED_EVENT", None) for f in filters}
+        if self._is_and:
+            required.discard(None)
+            if len(required) == 1:
+                self.REQUIRED_EVENT = required.pop()
+        elif len(required) == 1 and None not in required:
+            self.REQUIRED_EVENT = required.pop()
+
     async def check(self, event: WebhookEvent) -> bool:
-        """Check if event matches combined filters"""
+        """Check if event matches combined filters (short-circuits)"""
         if not self.filters:
             return True
 
-        results = []
-        for filter_obj in self.filters:
-            result = await filter_obj.check(event)
-            results.append(result)
+        if self._is_and:
+            for filter_obj in self.filters:
+                result = filter_obj.check(event)
+                if inspect.isawaitable(result):
+                    result = await result
+                if not result:
+                    return False
+            return True
 
-        if self.logic == "AND":
-            return all(results)
-        else:  # OR
-            return any(results)
+        # OR: first match wins
+        for filter_obj in self.filters:
+            result = filter_obj.check(event)
+            if inspect.isawaitable(result):
+                result = await result
+            if result:
+                return True
+        return False
 
 
 # Convenience functions
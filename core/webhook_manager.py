@@ -30,6 +30,9 @@ class WebhookManager:
             "Authorization": self.api_token,
             "Content-Type": "application/json",
         }
+        # Shared session reuses the TCP/TLS connection across API calls
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
     
     def delete_webhook(self, webhook_id: str) -> dict:
         """
@@ -42,9 +45,8 @@ class WebhookManager:
             API response dictionary
         """
         try:
-            resp = requests.delete(
+            resp = self._session.delete(
                 f"{self.base_url}/webhook/{webhook_id}",
-                headers=self.headers,
                 timeout=10
             )
             resp.raise_for_status()
@@ -63,9 +65,8 @@ class WebhookManager:
             API response dictionary with webhooks list
         """
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.base_url}/team/{self.team_id}/webhook",
-                headers=self.headers,
                 timeout=10
             )
             resp.raise_for_status()
@@ -113,9 +114,8 @@ class WebhookManager:
         }
         
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/team/{self.team_id}/webhook",
-                headers=self.headers,
                 json=webhook_payload,
                 timeout=10
             )
@@ -18,6 +18,14 @@ from clickup_sdk.webhook import (
 
 from webhook_setter import WebhookManager
 
+# Use the libuv event loop when available (optional speedup)
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 
 logging.basicConfig(
     level=logging.INFO,
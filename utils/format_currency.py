@@ -16,6 +16,9 @@ NUMBER_SUFFIX = " ta"
 DATE_FORMAT = "%d.%m.%Y"
 MILLISECONDS_TO_SECONDS = 1000
 
+# Translation table for swapping thousands separators in one C-level pass
+_COMMA_TO_SPACE = str.maketrans({",": " "})
+
 
 def format_currency(value: Optional[Union[int, str, float]]) -> str:
     """
@@ -29,9 +32,13 @@ def format_currency(value: Optional[Union[int, str, float]]) -> str:
     """
     if not value:
         return DEFAULT_VALUE
+    # Fast path: values from the API are usually already ints, so skip
+    # int()'s parse/convert machinery and its exception handling
+    if type(value) is int:
+        return f"{value:,d}".translate(_COMMA_TO_SPACE) + CURRENCY_SUFFIX
     try:
         num = int(value)
-        return f"{num:,}".replace(",", " ") + CURRENCY_SUFFIX
+        return f"{num:,d}".translate(_COMMA_TO_SPACE) + CURRENCY_SUFFIX
     except (ValueError, TypeError) as e:
-        logger.warning(f"Failed to format currency value {value}: {e}")
+        logger.warning("Failed to format currency value %s: %s", value, e)
         return str(value)
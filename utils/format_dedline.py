@@ -31,8 +31,11 @@ def format_deadline(deadline: Optional[Union[int, str, float]]) -> str:
     try:
         if isinstance(deadline, (int, str)):
             timestamp = int(deadline) / MILLISECONDS_TO_SECONDS
-            return datetime.fromtimestamp(timestamp).strftime(DATE_FORMAT)
+            dt = datetime.fromtimestamp(timestamp)
+            # DATE_FORMAT rendered directly; skips strftime's per-call
+            # format parsing and locale machinery
+            return f"{dt.day:02d}.{dt.month:02d}.{dt.year}"
         return str(deadline)
     except (ValueError, TypeError, OSError) as e:
-        logger.warning(f"Failed to format deadline {deadline}: {e}")
+        logger.warning("Failed to format deadline %s: %s", deadline, e)
         return str(deadline)
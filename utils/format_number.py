@@ -25,8 +25,12 @@ def format_number(value: Optional[Union[int, str, float]]) -> str:
     """
     if not value:
         return DEFAULT_VALUE
+    # Fast path: values from the API are usually already ints, so skip
+    # int()'s parse/convert machinery and its exception handling
+    if type(value) is int:
+        return f"{value}{NUMBER_SUFFIX}"
     try:
         return f"{int(value)}{NUMBER_SUFFIX}"
     except (ValueError, TypeError) as e:
-        logger.warning(f"Failed to format number value {value}: {e}")
+        logger.warning("Failed to format number value %s: %s", value, e)
         return str(value)
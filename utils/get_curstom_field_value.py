@@ -30,3 +30,30 @@ def get_custom_field_value(task: Dict[str, Any], field_name: str) -> Optional[An
             return cf.get("value")
 
     return None
+
+
+def get_custom_field_map(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a name -> value mapping of all custom fields in one pass.
+
+    Prefer this over repeated get_custom_field_value() calls when
+    looking up several fields from the same task.
+
+    Args:
+        task: ClickUp task dictionary
+
+    Returns:
+        Dictionary mapping custom field names to their values
+    """
+    if not task:
+        return {}
+
+    custom_fields = task.get("custom_fields", [])
+    if not isinstance(custom_fields, list):
+        return {}
+
+    return {
+        cf["name"]: cf.get("value")
+        for cf in custom_fields
+        if isinstance(cf, dict) and "name" in cf
+    }
@@ -0,0 +1,29 @@
+"""
+Utility function to extract status names from ClickUp tasks.
+"""
+
+from typing import Any
+
+# Constants
+DEFAULT_VALUE = "N/A"
+
+
+def get_status_name(status: Any, default: str = DEFAULT_VALUE) -> str:
+    """
+    Extract the status name from a task's status value.
+
+    Relies on duck typing instead of an isinstance branch: the dict
+    path dominates in practice, so one .get attribute lookup replaces
+    a type check plus a conditional per task.
+
+    Args:
+        status: Task status value (normally a dict with a "status" key)
+        default: Value returned when no status name can be extracted
+
+    Returns:
+        Status name string or the default value
+    """
+    try:
+        return status.get("status", default)
+    except AttributeError:
+        return default